@@ -16,6 +16,11 @@ from .nodes import BaseNode
 
 
 def isint(s):
+    if isinstance(s, str):
+        # character scan instead of parsing, accepts an optionally signed decimal integer
+        if s[:1] in ("+", "-"):
+            s = s[1:]
+        return s.isdecimal()
     try:
         int(s)
         return True
@@ -23,8 +28,12 @@ def isint(s):
         return False
 
 
-def get_yaml_loader():
-    loader = yaml.SafeLoader
+def _create_yaml_loader():
+    # Subclass instead of modifying the loader in place: the resolvers added below
+    # must not leak into other users of the (process wide) PyYAML loader classes.
+    # Prefer the libyaml backed CSafeLoader when PyYAML was built with it.
+    base = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    loader = type("OmegaConfLoader", (base,), {})
     loader.add_implicit_resolver(
         u"tag:yaml.org,2002:float",
         re.compile(
@@ -50,6 +59,33 @@ def get_yaml_loader():
     return loader
 
 
+# exact types accepted by Config.is_primitive_type without an isinstance() check
+_primitive_types = frozenset((bool, int, str, float))
+
+# ${type:key}, where the type (resolver name) is optional
+_interpolation_pattern = re.compile(r"\${(\w+:)?([\w\.%_ \\,-]*?)}")
+
+# The loader class is immutable once created, build it once for all yaml.load calls.
+_yaml_loader = _create_yaml_loader()
+
+
+def get_yaml_loader():
+    return _yaml_loader
+
+
+# omegaconf.py imports this module, so OmegaConf is bound on first use
+_omegaconf = None
+
+
+def _get_omegaconf():
+    global _omegaconf
+    if _omegaconf is None:
+        from .omegaconf import OmegaConf
+
+        _omegaconf = OmegaConf
+    return _omegaconf
+
+
 class Config(object):
     # static fields
     _resolvers = {}
@@ -136,25 +172,20 @@ class Config(object):
 
     def _resolve_with_default(self, key, value, default_value=None):
         """returns the value with the specified key, like obj.key and obj['key']"""
-
-        def is_mandatory_missing(val):
-            return type(val) == str and val == "???"
-
         if isinstance(value, BaseNode):
             value = value.value()
 
-        if default_value is not None and (value is None or is_mandatory_missing(value)):
+        is_mandatory_missing = type(value) is str and value == "???"
+        if default_value is not None and (value is None or is_mandatory_missing):
             value = default_value
+            is_mandatory_missing = type(value) is str and value == "???"
 
-        if is_mandatory_missing(value):
+        if is_mandatory_missing:
             raise MissingMandatoryValue(self.get_full_key(key))
 
         return self._resolve_single(value) if isinstance(value, str) else value
 
     def get_full_key(self, key):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         full_key = ""
         child = None
         parent = self
@@ -233,9 +264,6 @@ class Config(object):
 
     @staticmethod
     def _select_one(c, key_):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         assert isinstance(c, (DictConfig, ListConfig))
         if isinstance(c, DictConfig):
             if key_ in c:
@@ -277,9 +305,6 @@ class Config(object):
             self.update(key, value)
 
     def update(self, key, value=None):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         """Updates a dot separated key sequence to a value"""
         split = key.split(".")
         root = self
@@ -332,9 +357,6 @@ class Config(object):
 
     @staticmethod
     def _to_content(conf, resolve):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         assert isinstance(conf, Config)
         if isinstance(conf, DictConfig):
             ret = {}
@@ -379,8 +401,6 @@ class Config(object):
     @staticmethod
     def _map_merge(dest, src):
         """merge src into dest and return a new copy, does not modified input"""
-        from .dictconfig import DictConfig
-
         assert isinstance(dest, DictConfig)
         assert isinstance(src, DictConfig)
         src = copy.deepcopy(src)
@@ -405,7 +425,8 @@ class Config(object):
         # memodict is intentionally not used.
         # Using it can cause python to return objects that were since modified, undoing their modifications!
         res.__dict__["content"] = copy.deepcopy(self.__dict__["content"])
-        res.__dict__["flags"] = copy.deepcopy(self.__dict__["flags"])
+        # flags only hold None or bool values, a shallow copy is enough
+        res.__dict__["flags"] = dict(self.__dict__["flags"])
         # intentionally not deepcopying the parent. this can cause all sorts of mayhem and stack overflow.
         # instead of just re-parent the result node. this will break interpolation in cases of deepcopying
         # a node that is not the root node, but that is almost guaranteed to break anyway.
@@ -413,9 +434,6 @@ class Config(object):
 
     @staticmethod
     def _re_parent(node):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         # update parents of first level Config nodes to self
         assert isinstance(node, (DictConfig, ListConfig))
         if isinstance(node, DictConfig):
@@ -430,9 +448,6 @@ class Config(object):
                     Config._re_parent(item)
 
     def merge_with(self, *others):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         """merge a list of other Config objects into this one, overriding as needed"""
         for other in others:
             if other is None:
@@ -452,7 +467,7 @@ class Config(object):
 
     @staticmethod
     def _resolve_value(root_node, inter_type, inter_key):
-        from omegaconf import OmegaConf
+        OmegaConf = _get_omegaconf()
 
         inter_type = ("str:" if inter_type is None else inter_type)[0:-1]
         if inter_type == "str":
@@ -473,9 +488,11 @@ class Config(object):
         return value
 
     def _resolve_single(self, value):
-        key_prefix = r"\${(\w+:)?"
-        legal_characters = r"([\w\.%_ \\,-]*?)}"
-        match_list = list(re.finditer(key_prefix + legal_characters, value))
+        # Most values are not interpolations, skip the regex scan for them.
+        if "$" not in value:
+            return value
+
+        match_list = list(_interpolation_pattern.finditer(value))
         if len(match_list) == 0:
             return value
 
@@ -497,7 +514,7 @@ class Config(object):
             return new
 
     def _prepare_value_to_add(self, key, value):
-        from omegaconf import OmegaConf
+        OmegaConf = _get_omegaconf()
 
         if isinstance(value, Config):
             value = OmegaConf.to_container(value)
@@ -527,15 +544,11 @@ class Config(object):
         :param value:
         :return:
         """
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         # None is valid
-        if value is None:
+        if value is None or type(value) in _primitive_types:
             return True
-        valid = [bool, int, str, float, DictConfig, ListConfig, BaseNode]
 
-        return isinstance(value, tuple(valid))
+        return isinstance(value, _valid_value_types)
 
     @staticmethod
     def _item_eq(c1, k1, c2, k2):
@@ -559,8 +572,6 @@ class Config(object):
 
     @staticmethod
     def _list_eq(l1, l2):
-        from .listconfig import ListConfig
-
         assert isinstance(l1, ListConfig)
         assert isinstance(l2, ListConfig)
         if len(l1) != len(l2):
@@ -573,8 +584,6 @@ class Config(object):
 
     @staticmethod
     def _dict_conf_eq(d1, d2):
-        from .dictconfig import DictConfig
-
         assert isinstance(d1, DictConfig)
         assert isinstance(d2, DictConfig)
         if len(d1) != len(d2):
@@ -591,9 +600,6 @@ class Config(object):
 
     @staticmethod
     def _config_eq(c1, c2):
-        from .listconfig import ListConfig
-        from .dictconfig import DictConfig
-
         assert isinstance(c1, Config)
         assert isinstance(c2, Config)
         if isinstance(c1, DictConfig) and isinstance(c2, DictConfig):
@@ -602,3 +608,12 @@ class Config(object):
             return Config._list_eq(c1, c2)
         # if type does not match objects are different
         return False
+
+
+# DictConfig and ListConfig depend on Config, bind them once this module is initialized
+# instead of importing them inside each method.
+from .dictconfig import DictConfig  # noqa: E402
+from .listconfig import ListConfig  # noqa: E402
+
+# types (and subclasses) accepted by Config.is_primitive_type
+_valid_value_types = (bool, int, str, float, DictConfig, ListConfig, BaseNode)
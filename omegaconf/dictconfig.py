@@ -36,28 +36,22 @@ class DictConfig(Config):
 
         value = self._prepare_value_to_add(key, value)
 
-        if key not in self.content and self._get_flag("struct") is True:
+        content = self.__dict__["content"]
+        node = content.get(key, self.__marker)
+        if node is self.__marker and self._get_flag("struct") is True:
             raise KeyError(
                 "Accessing unknown key in a struct : {}".format(self.get_full_key(key))
             )
 
-        input_config_or_node = isinstance(value, (BaseNode, Config))
-        if key in self:
+        if isinstance(value, (BaseNode, Config)):
             # BaseNode or Config, assign as is
-            if input_config_or_node:
-                self.__dict__["content"][key] = value
-            else:
-                # primitive input
-                if isinstance(self.__dict__["content"][key], Config):
-                    # primitive input replaces config nodes
-                    self.__dict__["content"][key] = value
-                else:
-                    self.__dict__["content"][key].set_value(value)
+            content[key] = value
+        elif isinstance(node, BaseNode):
+            # primitive input updates the existing node
+            node.set_value(value)
         else:
-            if input_config_or_node:
-                self.__dict__["content"][key] = value
-            else:
-                self.__dict__["content"][key] = UntypedNode(value)
+            # new key, or primitive input replacing a config node
+            content[key] = UntypedNode(value)
 
     # hide content while inspecting in debugger
     def __dir__(self):
@@ -100,13 +94,17 @@ class DictConfig(Config):
         )
 
     def get_node(self, key, default_value=None):
-        value = self.__dict__["content"].get(key)
-        if key not in self.content and self._get_flag("struct"):
-            if default_value is not None:
-                return default_value
-            raise KeyError(
-                "Accessing unknown key in a struct : {}".format(self.get_full_key(key))
-            )
+        value = self.__dict__["content"].get(key, self.__marker)
+        if value is self.__marker:
+            if self._get_flag("struct"):
+                if default_value is not None:
+                    return default_value
+                raise KeyError(
+                    "Accessing unknown key in a struct : {}".format(
+                        self.get_full_key(key)
+                    )
+                )
+            return None
         return value
 
     __marker = object()
@@ -129,11 +127,8 @@ class DictConfig(Config):
         :param key:
         :return:
         """
-        try:
-            node = self.get_node(key)
-        except KeyError:
-            node = None
-
+        # not going through get_node(), membership tests never raise for struct configs
+        node = self.__dict__["content"].get(key)
         if node is None:
             return False
         else:
@@ -150,39 +145,17 @@ class DictConfig(Config):
         return iter(self.keys())
 
     def items(self, resolve=True, keys=None):
-        class MyItems(object):
-            def __init__(self, m):
-                self.map = m
-                self.iterator = iter(m)
-
-            def __iter__(self):
-                return self
-
-            def __next__(self):
-                k, v = self._next_pair()
-                if keys is not None:
-                    while True:
-                        if k not in keys:
-                            k, v = self._next_pair()
-                        else:
-                            break
-                return k, v
-
-            def next(self):
-                return self.__next__()
-
-            def _next_pair(self):
-                k = next(self.iterator)
-                if resolve:
-                    v = self.map.get(k)
-                else:
-                    v = self.map.content[k]
-                    if isinstance(v, BaseNode):
-                        v = v.value()
-                kv = (k, v)
-                return kv
-
-        return MyItems(self)
+        content = self.__dict__["content"]
+        for k in content:
+            if keys is not None and k not in keys:
+                continue
+            if resolve:
+                v = self.get(k)
+            else:
+                v = content[k]
+                if isinstance(v, BaseNode):
+                    v = v.value()
+            yield k, v
 
     def __eq__(self, other):
         if isinstance(other, dict):
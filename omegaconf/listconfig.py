@@ -13,10 +13,7 @@ class ListConfig(Config):
         self.__dict__["parent"] = parent
         assert isinstance(content, (list, tuple))
         for item in content:
-            if isinstance(item, dict) or isinstance(item, (list, tuple)):
-                from omegaconf import OmegaConf
-
-                item = OmegaConf.create(item, parent=self)
+            # nested dicts and lists are converted to configs by append
             self.append(item)
 
     def __deepcopy__(self, memodict={}):
@@ -5,6 +5,9 @@ import math
 
 
 class BaseNode(object):
+    # configs can hold many nodes, avoid a per instance __dict__
+    __slots__ = ("val",)
+
     def __init__(self):
         self.val = None
 
@@ -33,8 +36,28 @@ class BaseNode(object):
             return not x
         return NotImplemented
 
+    # Support pickle
+    def __getstate__(self):
+        # include the __dict__ of subclasses that do not declare __slots__
+        state = dict(getattr(self, "__dict__", {}))
+        state["val"] = self.val
+        return state
+
+    # Support pickle
+    def __setstate__(self, state):
+        # Pickles created before nodes used __slots__ carry a plain {"val": ...} dict.
+        # Slotted objects pickled without __getstate__ carry a (dict, slots) tuple.
+        if isinstance(state, tuple):
+            dict_state, slots_state = state
+            state = dict(dict_state or {})
+            state.update(slots_state or {})
+        for key, value in state.items():
+            setattr(self, key, value)
+
 
 class UntypedNode(BaseNode):
+    __slots__ = ()
+
     def __init__(self, value=None):
         self.val = None
         self.set_value(value)
@@ -44,6 +67,8 @@ class UntypedNode(BaseNode):
 
 
 class StringNode(BaseNode):
+    __slots__ = ()
+
     def __init__(self, value=None):
         self.val = None
         self.set_value(value)
@@ -53,11 +78,16 @@ class StringNode(BaseNode):
 
 
 class IntegerNode(BaseNode):
+    __slots__ = ()
+
     def __init__(self, value=None):
         self.val = None
         self.set_value(value)
 
     def set_value(self, value):
+        if type(value) is int:
+            self.val = value
+            return
         try:
             self.val = int(value) if value is not None else None
         except ValueError:
@@ -67,11 +97,16 @@ class IntegerNode(BaseNode):
 
 
 class FloatNode(BaseNode):
+    __slots__ = ()
+
     def __init__(self, value=None):
         self.val = None
         self.set_value(value)
 
     def set_value(self, value):
+        if type(value) is float:
+            self.val = value
+            return
         try:
             self.val = float(value) if value is not None else None
         except ValueError:
@@ -85,10 +120,34 @@ class FloatNode(BaseNode):
         else:
             other_val = other
 
-        return self.val == other_val or (math.isnan(self.val) and math.isnan(other_val))
+        if self.val is None or other_val is None:
+            return self.val is other_val
+        if self.val == other_val:
+            return True
+        # nan is treated as equal to nan
+        return (
+            isinstance(self.val, float)
+            and isinstance(other_val, float)
+            and math.isnan(self.val)
+            and math.isnan(other_val)
+        )
+
+
+_bool_strings = {
+    "yes": True,
+    "y": True,
+    "on": True,
+    "true": True,
+    "no": False,
+    "n": False,
+    "off": False,
+    "false": False,
+}
 
 
 class BooleanNode(BaseNode):
+    __slots__ = ()
+
     def __init__(self, value=None):
         self.val = None
         self.set_value(value)
@@ -101,18 +160,14 @@ class BooleanNode(BaseNode):
         elif value is None:
             self.val = False
         elif isinstance(value, str):
+            val = _bool_strings.get(value.lower())
+            if val is not None:
+                self.val = val
+                return
             try:
                 self.set_value(int(value))
-                return
             except ValueError:
-                if value.lower() in ("yes", "y", "on", "true"):
-                    self.val = True
-                elif value.lower() in ("no", "n", "off", "false"):
-                    self.val = False
-                else:
-                    raise ValidationError(
-                        "Value '{}' is not a valid bool".format(value)
-                    )
+                raise ValidationError("Value '{}' is not a valid bool".format(value))
         else:
             raise ValidationError(
                 "Value '{}' has unsupported type {}".format(value, type(value).__name__)
@@ -8,7 +8,9 @@ import io
 import re
 import yaml
 
-from .config import Config
+from .config import Config, get_yaml_loader
+from .dictconfig import DictConfig
+from .listconfig import ListConfig
 
 
 def register_default_resolvers():
@@ -29,10 +31,6 @@ class OmegaConf:
 
     @staticmethod
     def create(obj=None, parent=None):
-        from .dictconfig import DictConfig
-        from .listconfig import ListConfig
-        from .config import get_yaml_loader
-
         if isinstance(obj, str):
             new_obj = yaml.load(obj, Loader=get_yaml_loader())
             if new_obj is None:
@@ -53,8 +51,6 @@ class OmegaConf:
 
     @staticmethod
     def load(file_):
-        from .config import get_yaml_loader
-
         if isinstance(file_, str):
             with io.open(os.path.abspath(file_), "r", encoding="utf-8") as f:
                 return OmegaConf.create(yaml.load(f, Loader=get_yaml_loader()))
@@ -191,8 +187,6 @@ class OmegaConf:
         :param keys: keys to preserve in the copy
         :return:
         """
-        from .dictconfig import DictConfig
-
         if not isinstance(conf, DictConfig):
             raise ValueError("masked_copy is only supported for DictConfig")
 
@@ -253,31 +247,16 @@ def open_dict(config):
 
 
 def decode_primitive(s):
-    def is_bool(st):
-        st = str.lower(st)
-        return st == "true" or st == "false"
+    lowered = s.lower()
+    if lowered == "true" or lowered == "false":
+        return lowered == "true"
 
-    def is_float(st):
-        try:
-            float(st)
-            return True
-        except ValueError:
-            return False
-
-    def is_int(s):
-        try:
-            int(s)
-            return True
-        except ValueError:
-            return False
-
-    if is_bool(s):
-        return str.lower(s) == "true"
-
-    if is_int(s):
+    try:
         return int(s)
+    except ValueError:
+        pass
 
-    if is_float(s):
+    try:
         return float(s)
-
-    return s
+    except ValueError:
+        return s
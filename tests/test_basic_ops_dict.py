@@ -3,7 +3,16 @@ import tempfile
 
 import pytest
 
-from omegaconf import OmegaConf, MissingMandatoryValue, DictConfig, UntypedNode, Config
+from omegaconf import (
+    OmegaConf,
+    MissingMandatoryValue,
+    DictConfig,
+    UntypedNode,
+    Config,
+    StringNode,
+    IntegerNode,
+    ValidationError,
+)
 from . import IllegalType
 
 
@@ -431,3 +440,53 @@ def test_masked_copy_is_deep():
     assert masked == expected
     cfg.a.b = 2
     assert cfg != expected
+
+
+def test_assign_primitive_over_config_twice():
+    c = OmegaConf.create(dict(a=dict(b=1)))
+    c.a = 5
+    c.a = 6
+    assert c == dict(a=6)
+
+
+def test_assign_to_missing_keeps_node():
+    c = OmegaConf.create(dict(a="???"))
+    node = c.get_node("a")
+    c.a = 10
+    assert c.get_node("a") is node
+    assert c.a == 10
+
+
+@pytest.mark.parametrize("missing", ["???", "${not_found}"])
+def test_assign_to_missing_typed_node_converts_value(missing):
+    # typed nodes holding a missing or unresolvable value keep their type
+    c = OmegaConf.create(dict(a=StringNode(missing)))
+    c.a = 10
+    assert type(c.get_node("a")) is StringNode
+    assert c.a == "10"
+
+
+def test_assign_missing_to_integer_node():
+    # an IntegerNode cannot hold '???', it is validated like any other string
+    c = OmegaConf.create(dict(a=IntegerNode(10)))
+    with pytest.raises(ValidationError):
+        c.a = "???"
+    assert type(c.get_node("a")) is IntegerNode
+    assert c.a == 10
+
+
+def test_assign_does_not_resolve_existing_value():
+    calls = []
+
+    def resolver(key):
+        calls.append(key)
+        return key
+
+    try:
+        OmegaConf.register_resolver("record", resolver)
+        c = OmegaConf.create(dict(a="${record:foo}"))
+        c.a = 10
+        assert calls == []
+        assert c.a == 10
+    finally:
+        OmegaConf.clear_resolvers()
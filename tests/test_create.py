@@ -84,3 +84,12 @@ def test_create_from_oc():
         {"a": OmegaConf.create([1, 2, 3]), "b": OmegaConf.create({"c": 10})}
     )
     assert c == {"a": [1, 2, 3], "b": {"c": 10}}
+
+
+def test_create_does_not_modify_yaml_safe_loader():
+    import yaml
+
+    resolvers = yaml.SafeLoader.yaml_implicit_resolvers
+    OmegaConf.create("a: 1.0\nb: 2001-12-14")
+    assert yaml.SafeLoader.yaml_implicit_resolvers is resolvers
+    assert yaml.load("b: 2001-12-14", Loader=yaml.SafeLoader)["b"] != "2001-12-14"
@@ -1,3 +1,6 @@
+import copy
+import pickle
+
 import pytest
 
 from omegaconf import (
@@ -177,3 +180,71 @@ def test_merge_validation_error(c1, c2):
     # make sure that conf1 and conf2 were not modified
     assert conf1 == OmegaConf.create(c1)
     assert conf2 == OmegaConf.create(c2)
+
+
+class _NodeWithUnit(UntypedNode):
+    # user subclasses without __slots__ get a __dict__ for their own attributes
+    def __init__(self, value=None, unit=None):
+        super(_NodeWithUnit, self).__init__(value)
+        self.unit = unit
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        UntypedNode(10),
+        StringNode("abc"),
+        IntegerNode(10),
+        FloatNode(10.1),
+        BooleanNode(True),
+    ],
+)
+def test_node_has_no_dict(node):
+    assert not hasattr(node, "__dict__")
+
+
+@pytest.mark.parametrize(
+    "node",
+    [
+        UntypedNode(10),
+        StringNode("abc"),
+        IntegerNode(10),
+        FloatNode(10.1),
+        BooleanNode(True),
+        _NodeWithUnit(10, "km"),
+    ],
+)
+def test_node_copy_and_pickle(node):
+    copies = [copy.copy(node), copy.deepcopy(node)]
+    for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+        copies.append(pickle.loads(pickle.dumps(node, protocol=protocol)))
+    for copied in copies:
+        assert type(copied) is type(node)
+        assert copied == node
+        assert getattr(copied, "__dict__", None) == getattr(node, "__dict__", None)
+
+
+def test_deepcopy_config_with_node_subclass():
+    c = OmegaConf.create(dict(a=_NodeWithUnit(1, "km")))
+    c2 = copy.deepcopy(c)
+    assert c2.a == 1
+    assert c2.get_node("a").unit == "km"
+
+
+@pytest.mark.parametrize(
+    "node,other,expected",
+    [
+        (FloatNode(10.0), 10.0, True),
+        (FloatNode(10.0), FloatNode(10.0), True),
+        (FloatNode(float("nan")), float("nan"), True),
+        (FloatNode(float("nan")), FloatNode(float("nan")), True),
+        (FloatNode(float("nan")), 10.0, False),
+        (FloatNode(float("nan")), None, False),
+        (FloatNode(float("nan")), "nan", False),
+        (FloatNode(None), None, True),
+        (FloatNode(10.0), None, False),
+    ],
+)
+def test_float_node_eq(node, other, expected):
+    assert (node == other) == expected
+    assert (node != other) != expected
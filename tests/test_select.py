@@ -48,3 +48,11 @@ def test_list_select_non_int_key():
     c = OmegaConf.create([1, 2, 3])
     with raises(TypeError):
         c.select("a")
+
+
+def test_list_select_signed_int_key():
+    c = OmegaConf.create([1, 2, 3])
+    assert c.select("+1") == 2
+    assert c.select("-1") is None
+    with raises(TypeError):
+        c.select("1e3")
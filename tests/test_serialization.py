@@ -95,3 +95,33 @@ def test_pickle_list():
         fp.seek(0)
         c1 = pickle.load(fp)
         assert c == c1
+
+
+# OmegaConf.create(dict(a=1, b=[1, dict(c=2)])) pickled with protocol 2 by
+# OmegaConf 1.5.0rc1, before nodes used __slots__
+_legacy_pickle = (
+    b"\x80\x02comegaconf.dictconfig\nDictConf"
+    b"ig\nq\x00)\x81q\x01}q\x02(X\x05\x00\x00\x00flagsq\x03}q\x04(X\x08\x00"
+    b"\x00\x00readonlyq\x05NX\x06\x00\x00\x00structq\x06NuX\x0f\x00\x00"
+    b"\x00_resolver_cacheq\x07ccollections\nd"
+    b"efaultdict\nq\x08c__builtin__\ndict\nq"
+    b"\t\x85q\nRq\x0bX\x07\x00\x00\x00contentq\x0c}q\r(X\x01\x00\x00\x00aq"
+    b"\x0ecomegaconf.nodes\nUntypedNode\nq\x0f"
+    b")\x81q\x10}q\x11X\x03\x00\x00\x00valq\x12K\x01sbX\x01\x00\x00\x00bq\x13com"
+    b"egaconf.listconfig\nListConfig\nq\x14"
+    b")\x81q\x15}q\x16(h\x03}q\x17(h\x05Nh\x06Nuh\x07h\x08h\t\x85q\x18Rq"
+    b"\x19h\x0c]q\x1a(h\x0f)\x81q\x1b}q\x1ch\x12K\x01sbh\x0f)\x81q\x1d}q\x1eh"
+    b"\x12h\x00)\x81q\x1f}q (h\x03}q!(h\x05Nh\x06Nuh\x07h\x08h\t\x85q"
+    b"\"Rq#h\x0c}q$X\x01\x00\x00\x00cq%h\x0f)\x81q&}q'h\x12K\x02sb"
+    b"sX\x06\x00\x00\x00parentq(h\x15ubsbeh(h\x01ubuh(Nu"
+    b"b."
+)
+
+
+def test_load_legacy_pickle():
+    import pickle
+
+    c = pickle.loads(_legacy_pickle)
+    assert c == dict(a=1, b=[1, dict(c=2)])
+    # noinspection PyProtectedMember
+    assert c.b[1]._get_root() is c
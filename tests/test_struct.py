@@ -54,3 +54,11 @@ def test_struct_contain_missing():
     c = OmegaConf.create(dict())
     OmegaConf.set_struct(c, True)
     assert "foo" not in c
+
+
+def test_struct_dict_get_none_replacing_config():
+    c = OmegaConf.create(dict(a=dict(b=1)))
+    c.a = None
+    OmegaConf.set_struct(c, True)
+    assert c.a is None
+    assert c.get("a") is None